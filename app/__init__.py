@@ -0,0 +1 @@
+"""Order tracking service."""
@@ -0,0 +1,100 @@
+"""Authentication dependencies for route handlers."""
+
+import hashlib
+
+import jwt
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.security import decode_token
+from app.db.models import User, UserRole
+from app.db.session import get_db
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+# Short-TTL caches so a burst of requests with the same bearer token skips
+# the HMAC verification and the user SELECT. Keys are token digests, never
+# raw tokens; values are plain column snapshots, never session-bound ORM
+# instances. Worst-case staleness (e.g. a deactivated account) is one TTL.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """Resolve the authenticated user from the bearer token."""
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    key = _token_key(credentials.credentials)
+    user_id = _token_cache.get(key)
+    if user_id is None:
+        try:
+            payload = decode_token(credentials.credentials)
+        except jwt.PyJWTError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        user_id = int(payload["sub"])
+        _token_cache[key] = user_id
+
+    snapshot = _user_cache.get(user_id)
+    if snapshot is not None:
+        email, full_name, role, is_active, created_at = snapshot
+        if not is_active:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found or inactive",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        # Detached, read-only instance rebuilt from the snapshot; handlers
+        # only read attributes off it.
+        return User(
+            id=user_id,
+            email=email,
+            full_name=full_name,
+            role=role,
+            is_active=is_active,
+            created_at=created_at,
+        )
+
+    # Session.get checks the identity map first and compiles a cheaper
+    # PK query than a hand-built select on a miss.
+    user = await db.get(User, user_id)
+    if user is None or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found or inactive",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    _user_cache[user_id] = (
+        user.email,
+        user.full_name,
+        user.role,
+        user.is_active,
+        user.created_at,
+    )
+    return user
+
+
+def require_admin(user: User = Depends(get_current_user)) -> User:
+    """Allow only admin users through."""
+    if user.role != UserRole.admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required",
+        )
+    return user
@@ -0,0 +1,77 @@
+"""Password hashing and JWT helpers."""
+
+import time
+
+import bcrypt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+# JWT parameters never change at runtime; binding them once avoids
+# re-reading settings and rebuilding the algorithm/options structures on
+# every encode/decode.
+_SECRET = settings.jwt_secret
+_ALGORITHM = settings.jwt_algorithm
+_ALGORITHMS = (settings.jwt_algorithm,)
+_ISSUER = settings.jwt_issuer
+_AUDIENCE = settings.jwt_audience
+_EXPIRE_SECONDS = settings.access_token_expire_minutes * 60
+_DECODE_OPTIONS = {"require": ["exp", "iat", "sub"]}
+
+# Direct argon2-cffi calls: passlib's CryptContext added scheme
+# detection, deprecation checks and kwargs plumbing on top of every hash
+# and verify. New hashes use argon2 with the same parameters as before;
+# bcrypt hashes from before the migration keep verifying below.
+_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+
+def hash_password(password: str) -> str:
+    return _hasher.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if hashed_password.startswith("$argon2"):
+        try:
+            return _hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+    # Legacy bcrypt hash from before the argon2 migration.
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode(), hashed_password.encode()
+        )
+    except ValueError:
+        return False
+
+
+def create_access_token(subject: int, role: str) -> str:
+    """Issue a signed access token for the given user id and role."""
+    now = int(time.time())
+    payload = {
+        "sub": str(subject),
+        "role": role,
+        "iat": now,
+        "exp": now + _EXPIRE_SECONDS,
+        "iss": _ISSUER,
+        "aud": _AUDIENCE,
+    }
+    return jwt.encode(payload, _SECRET, algorithm=_ALGORITHM)
+
+
+def decode_token(token: str) -> dict:
+    """Verify a token's signature and claims, returning its payload.
+
+    Raises ``jwt.PyJWTError`` if the token is invalid or expired.
+    """
+    return jwt.decode(
+        token,
+        _SECRET,
+        algorithms=_ALGORITHMS,
+        audience=_AUDIENCE,
+        issuer=_ISSUER,
+        options=_DECODE_OPTIONS,
+    )
@@ -0,0 +1,67 @@
+"""Application settings assembled from environment variables."""
+
+import functools
+import os
+from dataclasses import dataclass
+
+
+def _split_csv(value: str) -> tuple[str, ...]:
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+def _build_sqlalchemy_url() -> str:
+    """Build the SQLAlchemy database URL.
+
+    An explicit ``DATABASE_URL`` wins; otherwise the URL is assembled from
+    the individual ``POSTGRES_*`` variables.
+    """
+    url = os.getenv("DATABASE_URL")
+    if url:
+        return url
+    user = os.getenv("POSTGRES_USER", "postgres")
+    password = os.getenv("POSTGRES_PASSWORD", "postgres")
+    host = os.getenv("POSTGRES_HOST", "localhost")
+    port = os.getenv("POSTGRES_PORT", "5432")
+    name = os.getenv("POSTGRES_DB", "order_tracking")
+    return f"postgresql+psycopg://{user}:{password}@{host}:{port}/{name}"
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of the service configuration."""
+
+    app_name: str
+    environment: str
+    database_url: str
+    jwt_secret: str
+    jwt_algorithm: str
+    jwt_issuer: str
+    jwt_audience: str
+    access_token_expire_minutes: int
+    allowed_origins: tuple[str, ...]
+    allowed_methods: tuple[str, ...]
+    allowed_headers: tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the configuration, read from the environment once.
+
+    The environment does not change at runtime, so the ~15 getenv calls
+    and three CSV splits only happen on the first call.
+    """
+    return Settings(
+        app_name=os.getenv("APP_NAME", "Order Tracking System"),
+        environment=os.getenv("ENVIRONMENT", "development"),
+        database_url=_build_sqlalchemy_url(),
+        jwt_secret=os.getenv("JWT_SECRET", "change-me-in-production"),
+        jwt_algorithm=os.getenv("JWT_ALGORITHM", "HS256"),
+        jwt_issuer=os.getenv("JWT_ISSUER", "order-tracking-system"),
+        jwt_audience=os.getenv("JWT_AUDIENCE", "order-tracking-clients"),
+        access_token_expire_minutes=int(
+            os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
+        ),
+        allowed_origins=_split_csv(os.getenv("ALLOWED_ORIGINS", "*")),
+        allowed_methods=_split_csv(os.getenv("ALLOWED_METHODS", "*")),
+        allowed_headers=_split_csv(os.getenv("ALLOWED_HEADERS", "*")),
+    )
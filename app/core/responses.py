@@ -0,0 +1,45 @@
+"""orjson-backed response class used across the service."""
+
+import functools
+from enum import Enum
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+# Response dataclasses are serialized natively by orjson (built in
+# since orjson 3, no OPT_SERIALIZE_DATACLASS flag needed), so handlers
+# may hand them to ORJSONResponse without a pydantic pass. DB timestamps
+# are naive UTC; OPT_NAIVE_UTC + OPT_UTC_Z renders them as RFC 3339 with
+# a Z suffix inside orjson's C datetime encoder.
+_DUMP_OPTIONS = (
+    orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(
+        f"Type is not JSON serializable: {type(obj).__name__}"
+    )
+
+
+# dumps with the default hook and option flags bound once at import;
+# handlers serializing outside ORJSONResponse (e.g. streaming) should
+# use this instead of re-binding per call.
+dumps = functools.partial(orjson.dumps, default=_default, option=_DUMP_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendering through orjson.
+
+    Returning one of these directly from a handler also makes FastAPI
+    skip its response_model validation/jsonable_encoder pass, so hot
+    endpoints pay for exactly one serialization.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
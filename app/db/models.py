@@ -0,0 +1,157 @@
+"""SQLAlchemy ORM models for users, orders and notification preferences."""
+
+import enum
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+)
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _enum_column(enum_cls: type[enum.Enum]) -> Enum:
+    # Stored as plain strings (native_enum=False, persisted by value), so
+    # reads and comparisons stay simple VARCHAR operations instead of
+    # going through database enum machinery.
+    return Enum(
+        enum_cls,
+        values_callable=lambda e: [member.value for member in e],
+        native_enum=False,
+    )
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class UserRole(enum.Enum):
+    customer = "customer"
+    admin = "admin"
+
+
+class OrderStatus(enum.Enum):
+    created = "created"
+    processing = "processing"
+    shipped = "shipped"
+    delivered = "delivered"
+    cancelled = "cancelled"
+
+
+class NotificationChannel(enum.Enum):
+    email = "email"
+    sms = "sms"
+    push = "push"
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    hashed_password: Mapped[str] = mapped_column(String(255))
+    full_name: Mapped[str | None] = mapped_column(String(255))
+    role: Mapped[UserRole] = mapped_column(
+        _enum_column(UserRole), default=UserRole.customer
+    )
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow
+    )
+
+    orders: Mapped[list["Order"]] = relationship(back_populates="user")
+
+
+class Order(Base):
+    __tablename__ = "orders"
+    __table_args__ = (
+        # Serves the per-user listing (user_id equality + created_at sort)
+        # and the admin listing (created_at sort) without a filesort.
+        Index("ix_orders_user_created", "user_id", "created_at"),
+        Index("ix_orders_created", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    order_number: Mapped[str] = mapped_column(
+        String(64), unique=True, index=True
+    )
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE")
+    )
+    title: Mapped[str] = mapped_column(String(255))
+    description: Mapped[str | None] = mapped_column(Text)
+    current_status: Mapped[OrderStatus] = mapped_column(
+        _enum_column(OrderStatus), default=OrderStatus.created
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
+    )
+
+    user: Mapped[User] = relationship(back_populates="orders")
+    status_history: Mapped[list["OrderStatusHistory"]] = relationship(
+        back_populates="order",
+        order_by="OrderStatusHistory.changed_at",
+        cascade="all, delete-orphan",
+    )
+
+
+class OrderStatusHistory(Base):
+    __tablename__ = "order_status_history"
+    __table_args__ = (
+        # Matches the relationship's changed_at ordering used on the
+        # detail endpoints.
+        Index(
+            "ix_order_status_history_order_changed",
+            "order_id",
+            "changed_at",
+            "id",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    order_id: Mapped[int] = mapped_column(
+        ForeignKey("orders.id", ondelete="CASCADE")
+    )
+    old_status: Mapped[OrderStatus | None] = mapped_column(
+        _enum_column(OrderStatus)
+    )
+    new_status: Mapped[OrderStatus] = mapped_column(_enum_column(OrderStatus))
+    note: Mapped[str | None] = mapped_column(Text)
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow
+    )
+
+    order: Mapped[Order] = relationship(back_populates="status_history")
+
+
+class NotificationPreference(Base):
+    __tablename__ = "notification_preferences"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), unique=True, index=True
+    )
+    channel: Mapped[NotificationChannel] = mapped_column(
+        _enum_column(NotificationChannel), default=NotificationChannel.email
+    )
+    email: Mapped[str | None] = mapped_column(String(255))
+    phone: Mapped[str | None] = mapped_column(String(32))
+    push_token: Mapped[str | None] = mapped_column(String(512))
+    order_updates_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
+    )
+
+    user: Mapped[User] = relationship()
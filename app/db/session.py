@@ -0,0 +1,98 @@
+"""Engine and session management.
+
+Two engines are maintained on purpose: the async engine backs the
+DB-bound request handlers, while the sync engine serves schema creation
+and the deliberately-sync auth endpoints whose password hashing must run
+in the threadpool (see ``routers/auth.py``).
+"""
+
+from collections.abc import AsyncGenerator, Generator
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import get_settings
+
+
+def _async_database_url(url: str) -> str:
+    """Map the configured URL onto its async driver equivalent."""
+    if url.startswith("postgresql+psycopg://"):
+        return url.replace("postgresql+psycopg://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+_settings = get_settings()
+
+_sync_connect_args: dict = {}
+if _settings.database_url.startswith("postgresql+psycopg://"):
+    # Let psycopg promote hot queries to server-side prepared statements
+    # after a few executions, cutting parse/plan cost on the backend.
+    _sync_connect_args["prepare_threshold"] = 5
+
+# pool_use_lifo keeps a small set of connections hot rather than cycling
+# through the whole pool; query_cache_size raises the compiled-statement
+# LRU above its default of 500 so hot statements never fall out.
+engine = create_engine(
+    _settings.database_url,
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=20,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    query_cache_size=1200,
+    future=True,
+    connect_args=_sync_connect_args,
+)
+
+async_engine = create_async_engine(
+    _async_database_url(_settings.database_url),
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=20,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    query_cache_size=1200,
+)
+
+SessionLocal = sessionmaker(
+    bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a request-scoped async session, committing on success."""
+    db = AsyncSessionLocal()
+    try:
+        yield db
+        await db.commit()
+    except BaseException:
+        await db.rollback()
+        raise
+    finally:
+        await db.close()
+
+
+def get_sync_db() -> Generator[Session, None, None]:
+    """Yield a request-scoped sync session, committing on success."""
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        db.close()
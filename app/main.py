@@ -0,0 +1,52 @@
+"""FastAPI application entry point."""
+
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.core.config import get_settings
+from app.core.responses import ORJSONResponse
+from app.db.models import Base
+from app.db.session import engine
+from app.routers import auth, notifications, orders
+
+settings = get_settings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints (including the deliberately-sync login/signup doing
+    # password hashing) dispatch onto the AnyIO threadpool; the default of
+    # 40 tokens saturates quickly under a burst of logins.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+    Base.metadata.create_all(bind=engine)
+    yield
+
+
+app = FastAPI(
+    title=settings.app_name,
+    description="Track orders and their status history.",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.allowed_origins or ("*",),
+    allow_credentials=True,
+    allow_methods=settings.allowed_methods,
+    allow_headers=settings.allowed_headers,
+)
+
+app.include_router(auth.router)
+app.include_router(orders.router)
+app.include_router(notifications.router)
+
+
+@app.get("/", tags=["health"])
+def health_check() -> dict:
+    """Liveness probe."""
+    return {"status": "ok", "service": settings.app_name}
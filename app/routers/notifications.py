@@ -0,0 +1,78 @@
+"""Notification-preference endpoints."""
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.deps import get_current_user
+from app.db.models import NotificationPreference, User
+from app.db.session import get_db
+from app.schemas import (
+    NOTIF_PREF_ADAPTER,
+    NotificationPreferenceResponse,
+    NotificationPreferenceUpsertRequest,
+)
+
+router = APIRouter(prefix="/notifications", tags=["notifications"])
+
+# Cached statement construction for the per-request preference lookup.
+_pref_by_user_stmt = lambda_stmt(
+    lambda: select(NotificationPreference).where(
+        NotificationPreference.user_id == bindparam("user_id")
+    )
+)
+
+
+@router.get("/preferences", response_model=NotificationPreferenceResponse)
+async def get_preferences(
+    request: Request,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Return the authenticated user's notification preferences.
+
+    Served with a weak ETag derived from the row's last modification so
+    polling clients can revalidate with a 304 instead of a full body.
+    """
+    pref = await db.scalar(_pref_by_user_stmt, {"user_id": user.id})
+    if pref is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Notification preferences not found",
+        )
+    etag = f'W/"{pref.id}-{int(pref.updated_at.timestamp())}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, max-age=30",
+        "Vary": "Authorization",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        NOTIF_PREF_ADAPTER.dump_json(NotificationPreferenceResponse.from_row(pref)),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@router.put("/preferences", response_model=NotificationPreferenceResponse)
+async def upsert_preferences(
+    payload: NotificationPreferenceUpsertRequest,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create or replace the authenticated user's notification preferences."""
+    pref = await db.scalar(_pref_by_user_stmt, {"user_id": user.id})
+    if pref is None:
+        pref = NotificationPreference(user_id=user.id)
+        db.add(pref)
+    pref.channel = payload.channel
+    pref.email = payload.email
+    pref.phone = payload.phone
+    pref.push_token = payload.push_token
+    pref.order_updates_enabled = payload.order_updates_enabled
+    await db.flush()
+    return Response(
+        NOTIF_PREF_ADAPTER.dump_json(NotificationPreferenceResponse.from_row(pref)),
+        media_type="application/json",
+    )
@@ -0,0 +1,308 @@
+"""Order CRUD and status-tracking endpoints."""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.auth.deps import get_current_user, require_admin
+from app.core.responses import dumps
+from app.db.models import Order, OrderStatusHistory, User, UserRole
+from app.db.session import get_db
+from app.schemas import (
+    HISTORY_ADAPTER,
+    ORDER_LIST_ENCODER,
+    ORDER_RESPONSE_ADAPTER,
+    OrderCreateRequest,
+    OrderDetailResponse,
+    OrderResponse,
+    OrderResponseStruct,
+    OrderStatusHistoryItem,
+    OrderStatusUpdateRequest,
+    OrderUpdateRequest,
+    order_row_to_kwargs,
+)
+
+router = APIRouter(prefix="/orders", tags=["orders"])
+
+# Hot lookup statements wrapped in lambda_stmt so the Select construction
+# itself is cached; per request only the bound parameters change.
+_order_by_id_stmt = lambda_stmt(
+    lambda: select(Order).where(Order.id == bindparam("order_id"))
+)
+_order_by_number_stmt = lambda_stmt(
+    lambda: select(Order).where(Order.order_number == bindparam("order_number"))
+)
+_order_detail_by_id_stmt = lambda_stmt(
+    lambda: select(Order)
+    .options(selectinload(Order.status_history))
+    .where(Order.id == bindparam("order_id"))
+)
+_order_detail_by_number_stmt = lambda_stmt(
+    lambda: select(Order)
+    .options(selectinload(Order.status_history))
+    .where(Order.order_number == bindparam("order_number"))
+)
+
+
+def _detail_json(
+    order: Order, history: list[OrderStatusHistoryItem]
+) -> bytes:
+    # Splice instead of nest: serialize the parent order and the history
+    # list through their own adapters and join the byte streams, rather
+    # than building a throwaway OrderDetailResponse whose nested list is
+    # walked again by the detail serializer.
+    head = ORDER_RESPONSE_ADAPTER.dump_json(OrderResponse.from_row(order))
+    return (
+        head[:-1] + b',"history":' + HISTORY_ADAPTER.dump_json(history) + b"}"
+    )
+
+
+def _scope_to_user(stmt, params: dict, user: User):
+    """Push the ownership check into the WHERE clause for non-admins.
+
+    Rows the user may not see never leave the database, and a miss is a
+    uniform 404 whether the order is absent or owned by someone else —
+    which also avoids leaking which order ids exist.
+    """
+    if user.role != UserRole.admin:
+        stmt = stmt + (
+            lambda s: s.where(Order.user_id == bindparam("auth_user_id"))
+        )
+        params["auth_user_id"] = user.id
+    return stmt
+
+
+@router.post(
+    "", response_model=OrderResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_order(
+    payload: OrderCreateRequest,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create an order and record its initial status-history entry."""
+    existing = await db.scalar(
+        _order_by_number_stmt, {"order_number": payload.order_number}
+    )
+    if existing is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Order number already exists",
+        )
+    order = Order(
+        order_number=payload.order_number,
+        user_id=user.id,
+        title=payload.title,
+        description=payload.description,
+    )
+    db.add(order)
+    await db.flush()
+    history = OrderStatusHistory(
+        order_id=order.id,
+        old_status=None,
+        new_status=order.current_status,
+        note="Order created",
+    )
+    db.add(history)
+    await db.flush()
+    return Response(
+        ORDER_RESPONSE_ADAPTER.dump_json(OrderResponse.from_row(order)),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
+
+
+@router.get("", response_model=list[OrderResponse])
+async def list_orders(
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    before: datetime | None = Query(
+        None, description="Return orders created strictly before this time"
+    ),
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """List orders, most recent first. Admins see every order.
+
+    Pagination is keyset-based: pass the ``created_at`` of the last row
+    from the previous page as ``before`` to fetch the next page.
+    """
+    # Column-level select: the listing only needs scalar values, so
+    # skipping ORM instance construction (identity map, attribute state,
+    # relationship placeholders) per row is pure savings. The rows come
+    # straight from the DB, hence model_construct over validation.
+    stmt = (
+        select(
+            Order.id,
+            Order.order_number,
+            Order.user_id,
+            Order.title,
+            Order.description,
+            Order.current_status,
+            Order.created_at,
+            Order.updated_at,
+        )
+        .order_by(Order.created_at.desc(), Order.id.desc())
+        .limit(limit)
+    )
+    if user.role != UserRole.admin:
+        stmt = stmt.where(Order.user_id == user.id)
+    if before is not None:
+        stmt = stmt.where(Order.created_at < before)
+    rows = (await db.execute(stmt)).mappings()
+    items = [OrderResponseStruct(**order_row_to_kwargs(row)) for row in rows]
+    return Response(
+        ORDER_LIST_ENCODER.encode(items), media_type="application/json"
+    )
+
+
+@router.get("/export")
+async def export_orders(
+    user: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """Stream every order as a JSON array (admin only).
+
+    Rows are fetched in batches of 500 via ``yield_per`` and encoded one
+    at a time, so an export never materializes the full table as ORM
+    instances or buffers the whole response body in memory.
+    """
+    stmt = (
+        select(Order)
+        .order_by(Order.created_at.desc(), Order.id.desc())
+        .execution_options(yield_per=500)
+    )
+
+    async def render() -> AsyncIterator[bytes]:
+        result = await db.stream(stmt)
+        separator = b"["
+        async for order in result.scalars():
+            yield separator + dumps(
+                {
+                    "id": order.id,
+                    "order_number": order.order_number,
+                    "user_id": order.user_id,
+                    "title": order.title,
+                    "description": order.description,
+                    "current_status": order.current_status.value,
+                    "created_at": order.created_at,
+                    "updated_at": order.updated_at,
+                }
+            )
+            separator = b","
+        if separator == b"[":
+            yield b"["
+        yield b"]"
+
+    return StreamingResponse(render(), media_type="application/json")
+
+
+@router.get("/by-number/{order_number}", response_model=OrderDetailResponse)
+async def lookup_by_number(
+    order_number: str,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Look up an order and its status history by order number."""
+    params = {"order_number": order_number}
+    stmt = _scope_to_user(_order_detail_by_number_stmt, params, user)
+    order = await db.scalar(stmt, params)
+    if order is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Order not found"
+        )
+    return Response(
+        _detail_json(
+            order, [OrderStatusHistoryItem.from_row(e) for e in order.status_history]
+        ),
+        media_type="application/json",
+    )
+
+
+@router.get("/{order_id}", response_model=OrderDetailResponse)
+async def get_order(
+    order_id: int,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Fetch a single order with its status history."""
+    params = {"order_id": order_id}
+    stmt = _scope_to_user(_order_detail_by_id_stmt, params, user)
+    order = await db.scalar(stmt, params)
+    if order is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Order not found"
+        )
+    return Response(
+        _detail_json(
+            order, [OrderStatusHistoryItem.from_row(e) for e in order.status_history]
+        ),
+        media_type="application/json",
+    )
+
+
+@router.patch("/{order_id}", response_model=OrderResponse)
+async def update_order(
+    order_id: int,
+    payload: OrderUpdateRequest,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Update an order's title and/or description."""
+    params = {"order_id": order_id}
+    stmt = _scope_to_user(_order_by_id_stmt, params, user)
+    order = await db.scalar(stmt, params)
+    if order is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Order not found"
+        )
+    if payload.title is not None:
+        order.title = payload.title
+    if payload.description is not None:
+        order.description = payload.description
+    # order is persistent; the unit of work already tracks the dirty
+    # attributes, so no add() is needed.
+    await db.flush()
+    return Response(
+        ORDER_RESPONSE_ADAPTER.dump_json(OrderResponse.from_row(order)),
+        media_type="application/json",
+    )
+
+
+@router.post("/{order_id}/status", response_model=OrderDetailResponse)
+async def update_status(
+    order_id: int,
+    payload: OrderStatusUpdateRequest,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Transition an order to a new status and append a history entry."""
+    params = {"order_id": order_id}
+    stmt = _scope_to_user(_order_detail_by_id_stmt, params, user)
+    order = await db.scalar(stmt, params)
+    if order is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Order not found"
+        )
+    old_status = order.current_status
+    order.current_status = payload.new_status
+    # order.id is already known, so the status update and the history
+    # insert go out in a single flush.
+    history = OrderStatusHistory(
+        order_id=order.id,
+        old_status=old_status,
+        new_status=payload.new_status,
+        note=payload.note,
+    )
+    db.add(history)
+    await db.flush()
+    history_items = [
+        OrderStatusHistoryItem.from_row(e) for e in order.status_history
+    ] + [OrderStatusHistoryItem.from_row(history)]
+    return Response(
+        _detail_json(order, history_items), media_type="application/json"
+    )
@@ -0,0 +1,294 @@
+"""Pydantic request schemas and dataclass response schemas.
+
+Request models stay ``BaseModel``: they sit on the ingress path and need
+full validation. Response objects are plain frozen dataclasses built
+from trusted DB rows — they carry no SchemaValidator at all and are
+serialized through the module-level ``TypeAdapter``s at the bottom.
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated, Literal
+
+import msgspec
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+)
+
+from app.db.models import NotificationChannel, OrderStatus, UserRole
+
+# Shared constrained-string aliases. Reusing one Annotated alias across
+# models lets pydantic's schema-build cache share a single core-schema
+# node (and validator) instead of building one per field.
+Title = Annotated[str, StringConstraints(min_length=1, max_length=255)]
+OrderNumber = Annotated[str, StringConstraints(min_length=3, max_length=64)]
+Description = Annotated[str, StringConstraints(max_length=5000)]
+Password = Annotated[str, StringConstraints(min_length=8, max_length=128)]
+Phone = Annotated[
+    str, StringConstraints(pattern=r"^\+?[0-9]{7,15}$", max_length=20)
+]
+PushToken = Annotated[str, StringConstraints(max_length=512)]
+
+# Literal mirrors of the small fixed DB enums for response fields: a
+# Literal gets a set-membership validator and exact OpenAPI values
+# without the heavier Enum validator, and stays in lockstep with
+# db.models via the value tuples below.
+OrderStatusValue = Literal[
+    "created", "processing", "shipped", "delivered", "cancelled"
+]
+UserRoleValue = Literal["customer", "admin"]
+NotificationChannelValue = Literal["email", "sms", "push"]
+
+
+class SignupRequest(BaseModel):
+    email: EmailStr = Field(..., description="Email address used to sign in")
+    password: Password = Field(..., description="Account password")
+    full_name: str | None = Field(
+        None, max_length=255, description="Display name"
+    )
+    role: UserRole | None = Field(
+        None, description="Account role; defaults to customer"
+    )
+
+
+class LoginRequest(BaseModel):
+    email: EmailStr = Field(..., description="Email address used to sign in")
+    password: str = Field(..., description="Account password")
+
+
+class OrderCreateRequest(BaseModel):
+    order_number: OrderNumber = Field(..., description="Unique order number")
+    title: Title = Field(..., description="Short order title")
+    description: Description | None = Field(
+        None, description="Free-form order description"
+    )
+
+
+class OrderUpdateRequest(BaseModel):
+    # Cold-path models: defer the core-schema build until first use so
+    # rarely-hit routes don't pay schema generation at import.
+    model_config = ConfigDict(defer_build=True)
+
+    title: Title | None = Field(None, description="Short order title")
+    description: Description | None = Field(
+        None, description="Free-form order description"
+    )
+
+
+class OrderStatusUpdateRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    new_status: OrderStatus = Field(..., description="Status to transition to")
+    note: Description | None = Field(
+        None, description="Optional note recorded in history"
+    )
+
+
+class NotificationPreferenceUpsertRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    channel: NotificationChannel = Field(
+        ..., description="Preferred notification channel"
+    )
+    email: EmailStr | None = Field(
+        None, description="Email address for the email channel"
+    )
+    phone: Phone | None = Field(
+        None, description="Phone number for the sms channel"
+    )
+    push_token: PushToken | None = Field(
+        None, description="Device token for the push channel"
+    )
+    order_updates_enabled: bool = Field(
+        True, description="Whether to notify on order status changes"
+    )
+
+
+# Response dataclasses carry bare annotations: Field(description=...)
+# metadata would be copied into every core schema and JSON schema built
+# from them, and input documentation lives on the request models.
+# slots=True drops the per-instance __dict__, which matters most for
+# OrderStatusHistoryItem on orders with long histories.
+@dataclass(frozen=True, slots=True)
+class TokenResponse:
+    access_token: str
+    token_type: str = "bearer"
+
+
+@dataclass(frozen=True, slots=True)
+class UserPublic:
+    id: int
+    # Plain str on purpose: the value comes from the DB where it was
+    # validated at signup, and EmailStr would install an email-validator
+    # pass per schema build for no gain on the egress path.
+    email: str
+    full_name: str | None
+    # Enum columns arrive as their str values (converted in from_row):
+    # pydantic-core then treats them as plain strings and orjson never
+    # has to fall back to the Python-level default() per enum field.
+    role: UserRoleValue
+    is_active: bool
+    created_at: datetime
+
+    @classmethod
+    def from_row(cls, user) -> "UserPublic":
+        # Trusted ORM row -> response object with no validation pass,
+        # the dataclass equivalent of model_construct.
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            role=user.role.value,
+            is_active=user.is_active,
+            created_at=user.created_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class OrderResponse:
+    id: int
+    order_number: str
+    user_id: int
+    title: str
+    description: str | None
+    current_status: OrderStatusValue
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_row(cls, order) -> "OrderResponse":
+        return cls(
+            id=order.id,
+            order_number=order.order_number,
+            user_id=order.user_id,
+            title=order.title,
+            description=order.description,
+            current_status=order.current_status.value,
+            created_at=order.created_at,
+            updated_at=order.updated_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class OrderStatusHistoryItem:
+    id: int
+    old_status: OrderStatusValue | None
+    new_status: OrderStatusValue
+    note: str | None
+    changed_at: datetime
+
+    @classmethod
+    def from_row(cls, entry) -> "OrderStatusHistoryItem":
+        return cls(
+            id=entry.id,
+            old_status=(
+                entry.old_status.value if entry.old_status is not None else None
+            ),
+            new_status=entry.new_status.value,
+            note=entry.note,
+            changed_at=entry.changed_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class OrderDetailResponse(OrderResponse):
+    # A shared immutable empty tuple instead of default_factory=list:
+    # no fresh list allocation per instance for an empty default.
+    history: tuple[OrderStatusHistoryItem, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class NotificationPreferenceResponse:
+    id: int
+    user_id: int
+    channel: NotificationChannelValue
+    email: str | None
+    phone: str | None
+    push_token: str | None
+    order_updates_enabled: bool
+    updated_at: datetime
+
+    @classmethod
+    def from_row(cls, pref) -> "NotificationPreferenceResponse":
+        return cls(
+            id=pref.id,
+            user_id=pref.user_id,
+            channel=pref.channel.value,
+            email=pref.email,
+            phone=pref.phone,
+            push_token=pref.push_token,
+            order_updates_enabled=pref.order_updates_enabled,
+            updated_at=pref.updated_at,
+        )
+
+
+# Interned order column names for row->kwargs conversion on the list
+# path. Literal keyword arguments are interned by the compiler, but keys
+# pulled out of a RowMapping at runtime are not guaranteed to be; a
+# shared interned tuple keeps every construction using the same key
+# objects so dict insertion hits pointer-equality fast paths.
+_ORDER_KEYS = tuple(
+    sys.intern(key)
+    for key in (
+        "id",
+        "order_number",
+        "user_id",
+        "title",
+        "description",
+        "current_status",
+        "created_at",
+        "updated_at",
+    )
+)
+
+
+def order_row_to_kwargs(row) -> dict:
+    """Copy an order row mapping into kwargs with interned keys.
+
+    Also folds the enum-to-value conversion done by the from_row
+    factories, so both construction paths emit identical field values.
+    """
+    kwargs = {key: row[key] for key in _ORDER_KEYS}
+    kwargs["current_status"] = kwargs["current_status"].value
+    return kwargs
+
+
+# msgspec mirror of OrderResponse for the highest-QPS path
+# (GET /orders). Struct instances are cheaper to build than dataclasses
+# and msgspec's C encoder beats the pydantic serializer on large
+# batches; frozen + gc=False skips cycle-tracking for these flat,
+# short-lived objects.
+class OrderResponseStruct(msgspec.Struct, frozen=True, gc=False):
+    id: int
+    order_number: str
+    user_id: int
+    title: str
+    description: str | None
+    current_status: OrderStatusValue
+    created_at: datetime
+    updated_at: datetime
+
+
+ORDER_LIST_ENCODER = msgspec.json.Encoder()
+
+
+# Serialization adapters, built once at import so the underlying Rust
+# SchemaSerializer is constructed a single time instead of per request.
+# dump_json goes straight from response objects to JSON bytes without a
+# Python-level dict materialization pass.
+#
+# Invariant: every TypeAdapter in the service lives here, at module
+# scope. Constructing one inside a handler repays the full core-schema
+# build on a hot path, so new adapters must be added to this block.
+ORDER_RESPONSE_ADAPTER: TypeAdapter = TypeAdapter(OrderResponse)
+ORDER_LIST_ADAPTER: TypeAdapter = TypeAdapter(list[OrderResponse])
+ORDER_DETAIL_ADAPTER: TypeAdapter = TypeAdapter(OrderDetailResponse)
+HISTORY_ADAPTER: TypeAdapter = TypeAdapter(list[OrderStatusHistoryItem])
+NOTIF_PREF_ADAPTER: TypeAdapter = TypeAdapter(NotificationPreferenceResponse)
+USER_PUBLIC_ADAPTER: TypeAdapter = TypeAdapter(UserPublic)